@@ -1,8 +1,12 @@
+import asyncio
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Annotated, Tuple
 from urllib.parse import urlparse, urlunparse
 
 import markdownify
 import readabilipy.simple_json
+from httpx import AsyncBaseTransport, AsyncClient, HTTPError, Request, Response
 from mcp.shared.exceptions import McpError
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -22,6 +26,8 @@ from pydantic import BaseModel, Field, AnyUrl
 
 DEFAULT_USER_AGENT_AUTONOMOUS = "ModelContextProtocol/1.0 (Autonomous; +https://github.com/modelcontextprotocol/servers)"
 DEFAULT_USER_AGENT_MANUAL = "ModelContextProtocol/1.0 (User-Specified; +https://github.com/modelcontextprotocol/servers)"
+ROBOTS_TXT_CACHE_TTL = 300  # seconds
+ROBOTS_TXT_CACHE_MAX_ENTRIES = 1024
 
 
 def extract_content_from_html(html: str) -> str:
@@ -63,35 +69,108 @@ def get_robots_txt_url(url: str) -> str:
     return robots_url
 
 
-async def check_may_autonomously_fetch_url(url: str, user_agent: str, proxy_url: str | None = None) -> None:
+class PooledTransport(AsyncBaseTransport):
+    """Transport that sends requests through a long-lived client.
+
+    Each fetch builds its own short-lived AsyncClient on top of this transport, so cookies
+    (including those set during a redirect chain) stay scoped to that fetch, while the
+    connection pool and proxy configuration of the shared client are reused.
+    """
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self.client.send(request, stream=True)
+
+
+async def fetch_robots_txt(
+    transport: AsyncBaseTransport, robot_txt_url: str, user_agent: str
+) -> Tuple[int, str | None]:
+    """
+    Fetch the robots.txt file at the given URL.
+    Returns the response status code and the file contents, which are None if the site does not serve one.
+    Raises a McpError if autonomous fetching should not proceed.
+    """
+    client = AsyncClient(transport=transport)
+    try:
+        response = await client.get(
+            robot_txt_url,
+            follow_redirects=True,
+            headers={"User-Agent": user_agent},
+        )
+    except HTTPError:
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Failed to fetch robots.txt {robot_txt_url} due to a connection issue",
+        ))
+    if response.status_code in (401, 403):
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"When fetching robots.txt ({robot_txt_url}), received status {response.status_code} so assuming that autonomous fetching is not allowed, the user can try manually fetching by using the fetch prompt",
+        ))
+    elif 400 <= response.status_code < 500:
+        return response.status_code, None
+    return response.status_code, response.text
+
+
+class RobotsTxtFetcher:
+    """Fetches robots.txt files, sharing a single request between concurrent lookups of the same site
+    and reusing definitive results for a short time."""
+
+    def __init__(
+        self,
+        transport: AsyncBaseTransport,
+        ttl: float = ROBOTS_TXT_CACHE_TTL,
+        max_entries: int = ROBOTS_TXT_CACHE_MAX_ENTRIES,
+    ):
+        self.transport = transport
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._pending: dict[Tuple[str, str], asyncio.Task[Tuple[int, str | None]]] = {}
+        self._cache: dict[Tuple[str, str], Tuple[float, str | None]] = {}
+
+    async def fetch(self, robot_txt_url: str, user_agent: str) -> str | None:
+        key = (robot_txt_url, user_agent)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch_robots_txt(self.transport, robot_txt_url, user_agent))
+            task.add_done_callback(lambda done: self._on_done(key, done))
+            self._pending[key] = task
+        # Shield the shared task so one cancelled caller does not cancel it for the others
+        _, robot_txt = await asyncio.shield(task)
+        return robot_txt
+
+    def _on_done(self, key: Tuple[str, str], task: asyncio.Task[Tuple[int, str | None]]) -> None:
+        self._pending.pop(key, None)
+        # Failures are not cached so that the next request retries them
+        if task.cancelled() or task.exception() is not None:
+            return
+        status_code, robot_txt = task.result()
+        # Only a served file or a definitive "no robots.txt" is cached; transient
+        # answers such as 429 or 5xx are passed through and retried next time
+        if not (200 <= status_code < 300 or status_code in (404, 410)):
+            return
+        self._cache.pop(key, None)
+        self._cache[key] = (time.monotonic(), robot_txt)
+        if len(self._cache) > self.max_entries:
+            del self._cache[next(iter(self._cache))]
+
+
+async def check_may_autonomously_fetch_url(robots: RobotsTxtFetcher, url: str, user_agent: str) -> None:
     """
     Check if the URL can be fetched by the user agent according to the robots.txt file.
     Raises a McpError if not.
     """
-    from httpx import AsyncClient, HTTPError
-
     robot_txt_url = get_robots_txt_url(url)
 
-    async with AsyncClient(proxies=proxy_url) as client:
-        try:
-            response = await client.get(
-                robot_txt_url,
-                follow_redirects=True,
-                headers={"User-Agent": user_agent},
-            )
-        except HTTPError:
-            raise McpError(ErrorData(
-                code=INTERNAL_ERROR,
-                message=f"Failed to fetch robots.txt {robot_txt_url} due to a connection issue",
-            ))
-        if response.status_code in (401, 403):
-            raise McpError(ErrorData(
-                code=INTERNAL_ERROR,
-                message=f"When fetching robots.txt ({robot_txt_url}), received status {response.status_code} so assuming that autonomous fetching is not allowed, the user can try manually fetching by using the fetch prompt",
-            ))
-        elif 400 <= response.status_code < 500:
-            return
-        robot_txt = response.text
+    robot_txt = await robots.fetch(robot_txt_url, user_agent)
+    if robot_txt is None:
+        return
     processed_robot_txt = "\n".join(
         line for line in robot_txt.splitlines() if not line.strip().startswith("#")
     )
@@ -109,30 +188,28 @@ async def check_may_autonomously_fetch_url(url: str, user_agent: str, proxy_url:
 
 
 async def fetch_url(
-    url: str, user_agent: str, force_raw: bool = False, proxy_url: str | None = None
+    transport: AsyncBaseTransport, url: str, user_agent: str, force_raw: bool = False
 ) -> Tuple[str, str]:
     """
     Fetch the URL and return the content in a form ready for the LLM, as well as a prefix string with status information.
     """
-    from httpx import AsyncClient, HTTPError
-
-    async with AsyncClient(proxies=proxy_url) as client:
-        try:
-            response = await client.get(
-                url,
-                follow_redirects=True,
-                headers={"User-Agent": user_agent},
-                timeout=30,
-            )
-        except HTTPError as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to fetch {url}: {e!r}"))
-        if response.status_code >= 400:
-            raise McpError(ErrorData(
-                code=INTERNAL_ERROR,
-                message=f"Failed to fetch {url} - status code {response.status_code}",
-            ))
+    client = AsyncClient(transport=transport)
+    try:
+        response = await client.get(
+            url,
+            follow_redirects=True,
+            headers={"User-Agent": user_agent},
+            timeout=30,
+        )
+    except HTTPError as e:
+        raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to fetch {url}: {e!r}"))
+    if response.status_code >= 400:
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Failed to fetch {url} - status code {response.status_code}",
+        ))
 
-        page_raw = response.text
+    page_raw = response.text
 
     content_type = response.headers.get("content-type", "")
     is_page_html = (
@@ -193,6 +270,15 @@ async def serve(
     server = Server("mcp-fetch")
     user_agent_autonomous = custom_user_agent or DEFAULT_USER_AGENT_AUTONOMOUS
     user_agent_manual = custom_user_agent or DEFAULT_USER_AGENT_MANUAL
+    # Shared across all requests so connections are kept alive and pooled. Each fetch sends
+    # through it from its own client, so cookies stay scoped to that fetch; the shared
+    # client's jar rejects everything so that nothing accumulates there.
+    pool = AsyncClient(
+        proxies=proxy_url,
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+    )
+    transport = PooledTransport(pool)
+    robots = RobotsTxtFetcher(transport)
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
@@ -232,10 +318,10 @@ Although originally you did not have internet access, and were advised to refuse
             raise McpError(ErrorData(code=INVALID_PARAMS, message="URL is required"))
 
         if not ignore_robots_txt:
-            await check_may_autonomously_fetch_url(url, user_agent_autonomous, proxy_url)
+            await check_may_autonomously_fetch_url(robots, url, user_agent_autonomous)
 
         content, prefix = await fetch_url(
-            url, user_agent_autonomous, force_raw=args.raw, proxy_url=proxy_url
+            transport, url, user_agent_autonomous, force_raw=args.raw
         )
         original_length = len(content)
         if args.start_index >= original_length:
@@ -262,7 +348,7 @@ Although originally you did not have internet access, and were advised to refuse
         url = arguments["url"]
 
         try:
-            content, prefix = await fetch_url(url, user_agent_manual, proxy_url=proxy_url)
+            content, prefix = await fetch_url(transport, url, user_agent_manual)
             # TODO: after SDK bug is addressed, don't catch the exception
         except McpError as e:
             return GetPromptResult(
@@ -284,5 +370,5 @@ Although originally you did not have internet access, and were advised to refuse
         )
 
     options = server.create_initialization_options()
-    async with stdio_server() as (read_stream, write_stream):
+    async with pool, stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, options, raise_exceptions=True)
@@ -0,0 +1,149 @@
+import asyncio
+
+import httpx
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp_server_fetch.server import RobotsTxtFetcher
+
+USER_AGENT = "test-agent"
+ROBOTS_TXT = "User-agent: *\nDisallow: /private\n"
+
+
+class Upstream:
+    """Mock robots.txt server that counts requests and can hold them open."""
+
+    def __init__(self, status_code: int = 200, text: str = ROBOTS_TXT):
+        self.status_code = status_code
+        self.text = text
+        self.requests: list[str] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        await self.release.wait()
+        return httpx.Response(self.status_code, text=self.text)
+
+
+def run_with_fetcher(upstream: Upstream, test, **kwargs):
+    async def _run():
+        return await test(RobotsTxtFetcher(httpx.MockTransport(upstream), **kwargs))
+
+    return asyncio.run(_run())
+
+
+def test_concurrent_lookups_share_one_request():
+    upstream = Upstream()
+
+    async def test(robots):
+        upstream.release.clear()
+        lookups = [
+            asyncio.create_task(robots.fetch("https://example.com/robots.txt", USER_AGENT))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return await asyncio.gather(*lookups)
+
+    results = run_with_fetcher(upstream, test)
+
+    assert results == [ROBOTS_TXT] * 5
+    assert len(upstream.requests) == 1
+
+
+def test_cancelled_caller_does_not_cancel_other_waiters():
+    upstream = Upstream()
+
+    async def test(robots):
+        upstream.release.clear()
+        cancelled = asyncio.create_task(robots.fetch("https://example.com/robots.txt", USER_AGENT))
+        waiting = asyncio.create_task(robots.fetch("https://example.com/robots.txt", USER_AGENT))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        upstream.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await waiting
+
+    assert run_with_fetcher(upstream, test) == ROBOTS_TXT
+    assert len(upstream.requests) == 1
+
+
+@pytest.mark.parametrize("status_code", [401, 403])
+def test_forbidden_error_reaches_every_waiter(status_code):
+    upstream = Upstream(status_code=status_code)
+
+    async def test(robots):
+        upstream.release.clear()
+        lookups = [
+            asyncio.create_task(robots.fetch("https://example.com/robots.txt", USER_AGENT))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return await asyncio.gather(*lookups, return_exceptions=True)
+
+    results = run_with_fetcher(upstream, test)
+
+    assert all(isinstance(result, McpError) for result in results)
+    assert len(upstream.requests) == 1
+
+
+@pytest.mark.parametrize("status_code", [401, 429, 500, 503])
+def test_error_and_transient_responses_are_not_cached(status_code):
+    upstream = Upstream(status_code=status_code, text="<html>Unavailable</html>")
+
+    async def test(robots):
+        for _ in range(2):
+            try:
+                await robots.fetch("https://example.com/robots.txt", USER_AGENT)
+            except McpError:
+                pass
+
+    run_with_fetcher(upstream, test)
+
+    assert len(upstream.requests) == 2
+
+
+@pytest.mark.parametrize("status_code,expected", [(200, ROBOTS_TXT), (404, None), (410, None)])
+def test_definitive_responses_are_cached(status_code, expected):
+    upstream = Upstream(status_code=status_code)
+
+    async def test(robots):
+        return [
+            await robots.fetch("https://example.com/robots.txt", USER_AGENT)
+            for _ in range(2)
+        ]
+
+    assert run_with_fetcher(upstream, test) == [expected, expected]
+    assert len(upstream.requests) == 1
+
+
+def test_oldest_entry_is_evicted_when_full():
+    upstream = Upstream()
+
+    async def test(robots):
+        for host in ("a", "b", "c", "a"):
+            await robots.fetch(f"https://{host}.example.com/robots.txt", USER_AGENT)
+
+    run_with_fetcher(upstream, test, max_entries=2)
+
+    assert upstream.requests == [
+        "https://a.example.com/robots.txt",
+        "https://b.example.com/robots.txt",
+        "https://c.example.com/robots.txt",
+        "https://a.example.com/robots.txt",
+    ]
+
+
+def test_expired_entries_are_refetched():
+    upstream = Upstream()
+
+    async def test(robots):
+        for _ in range(2):
+            await robots.fetch("https://example.com/robots.txt", USER_AGENT)
+
+    run_with_fetcher(upstream, test, ttl=0)
+
+    assert len(upstream.requests) == 2
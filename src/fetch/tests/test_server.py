@@ -0,0 +1,45 @@
+import asyncio
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+from mcp_server_fetch.server import PooledTransport, fetch_url
+
+USER_AGENT = "test-agent"
+
+
+def consent_site(request: httpx.Request) -> httpx.Response:
+    """Mock site that sets a consent cookie and redirects before serving the page."""
+    if request.url.path == "/start":
+        return httpx.Response(
+            302,
+            headers={"Location": "/page", "Set-Cookie": "consent=1; Path=/"},
+        )
+    cookie = request.headers.get("Cookie", "none")
+    return httpx.Response(200, text=f"cookie: {cookie}", headers={"Content-Type": "text/plain"})
+
+
+def fetch_twice(urls: list[str]) -> tuple[list[str], httpx.AsyncClient]:
+    async def _run():
+        pool = httpx.AsyncClient(
+            transport=httpx.MockTransport(consent_site),
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        async with pool:
+            transport = PooledTransport(pool)
+            contents = [(await fetch_url(transport, url, USER_AGENT))[0] for url in urls]
+        return contents, pool
+
+    return asyncio.run(_run())
+
+
+def test_cookie_set_on_redirect_is_sent_to_next_hop():
+    contents, _ = fetch_twice(["https://example.com/start"])
+
+    assert contents == ["cookie: consent=1"]
+
+
+def test_cookies_do_not_carry_over_between_fetches():
+    contents, pool = fetch_twice(["https://example.com/start", "https://example.com/page"])
+
+    assert contents == ["cookie: consent=1", "cookie: none"]
+    assert len(pool.cookies.jar) == 0
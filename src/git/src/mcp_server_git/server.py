@@ -236,7 +236,7 @@ async def serve(repository: Path | None) -> None:
                 return []
 
             roots_result: ListRootsResult = await server.request_context.session.list_roots()
-            logger.debug(f"Roots result: {roots_result}")
+            logger.debug("Roots result: %s", roots_result)
             repo_paths = []
             for root in roots_result.roots:
                 path = root.uri.path
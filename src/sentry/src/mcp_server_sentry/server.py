@@ -117,51 +117,54 @@ def create_stacktrace(latest_event: dict) -> str:
             exception_value = exception.get("value", "")
             stacktrace = exception.get("stacktrace")
 
-            stacktrace_text = f"Exception: {exception_type}: {exception_value}\n\n"
+            parts = [f"Exception: {exception_type}: {exception_value}\n\n"]
             if stacktrace:
-                stacktrace_text += "Stacktrace:\n"
+                parts.append("Stacktrace:\n")
                 for frame in stacktrace.get("frames", []):
                     filename = frame.get("filename", "Unknown")
                     lineno = frame.get("lineNo", "?")
                     function = frame.get("function", "Unknown")
 
-                    stacktrace_text += f"{filename}:{lineno} in {function}\n"
+                    parts.append(f"{filename}:{lineno} in {function}\n")
 
                     if "context" in frame:
                         context = frame["context"]
-                        for ctx_line in context:
-                            stacktrace_text += f"    {ctx_line[1]}\n"
+                        parts.extend(f"    {ctx_line[1]}\n" for ctx_line in context)
 
-                    stacktrace_text += "\n"
+                    parts.append("\n")
 
-            stacktraces.append(stacktrace_text)
+            stacktraces.append("".join(parts))
 
     return "\n".join(stacktraces) if stacktraces else "No stacktrace found"
 
 
 async def handle_sentry_issue(
-    http_client: httpx.AsyncClient, auth_token: str, issue_id_or_url: str
+    http_client: httpx.AsyncClient, issue_id_or_url: str
 ) -> SentryIssueData:
     try:
         issue_id = extract_issue_id(issue_id_or_url)
 
-        response = await http_client.get(
-            f"issues/{issue_id}/", headers={"Authorization": f"Bearer {auth_token}"}
-        )
-        if response.status_code == 401:
-            raise McpError(
-                "Error: Unauthorized. Please check your MCP_SENTRY_AUTH_TOKEN token."
-            )
-        response.raise_for_status()
-        issue_data = response.json()
-
-        # Get issue hashes
-        hashes_response = await http_client.get(
-            f"issues/{issue_id}/hashes/",
-            headers={"Authorization": f"Bearer {auth_token}"},
-        )
-        hashes_response.raise_for_status()
-        hashes = hashes_response.json()
+        # The issue and its hashes are independent, so request both concurrently
+        issue_task = asyncio.create_task(http_client.get(f"issues/{issue_id}/"))
+        hashes_task = asyncio.create_task(http_client.get(f"issues/{issue_id}/hashes/"))
+        try:
+            response = await issue_task
+            if response.status_code == 401:
+                raise McpError(
+                    "Error: Unauthorized. Please check your MCP_SENTRY_AUTH_TOKEN token."
+                )
+            response.raise_for_status()
+            issue_data = response.json()
+
+            hashes_response = await hashes_task
+            hashes_response.raise_for_status()
+            hashes = hashes_response.json()
+        finally:
+            # If either step failed, cancel the request still in flight and wait for
+            # both so that nothing is left running or unobserved in the background
+            for task in (issue_task, hashes_task):
+                task.cancel()
+            await asyncio.gather(issue_task, hashes_task, return_exceptions=True)
 
         if not hashes:
             raise McpError("No Sentry events found for this issue")
@@ -188,9 +191,8 @@ async def handle_sentry_issue(
         raise McpError(f"An error occurred: {str(e)}")
 
 
-async def serve(auth_token: str) -> Server:
+async def serve(http_client: httpx.AsyncClient) -> Server:
     server = Server("sentry")
-    http_client = httpx.AsyncClient(base_url=SENTRY_API_BASE)
 
     @server.list_prompts()
     async def handle_list_prompts() -> list[types.Prompt]:
@@ -216,7 +218,7 @@ async def serve(auth_token: str) -> Server:
             raise ValueError(f"Unknown prompt: {name}")
 
         issue_id_or_url = (arguments or {}).get("issue_id_or_url", "")
-        issue_data = await handle_sentry_issue(http_client, auth_token, issue_id_or_url)
+        issue_data = await handle_sentry_issue(http_client, issue_id_or_url)
         return issue_data.to_prompt_result()
 
     @server.list_tools()
@@ -253,7 +255,7 @@ async def serve(auth_token: str) -> Server:
         if not arguments or "issue_id_or_url" not in arguments:
             raise ValueError("Missing issue_id_or_url argument")
 
-        issue_data = await handle_sentry_issue(http_client, auth_token, arguments["issue_id_or_url"])
+        issue_data = await handle_sentry_issue(http_client, arguments["issue_id_or_url"])
         return issue_data.to_tool_result()
 
     return server
@@ -267,8 +269,14 @@ async def serve(auth_token: str) -> Server:
 )
 def main(auth_token: str):
     async def _run():
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            server = await serve(auth_token)
+        async with (
+            httpx.AsyncClient(
+                base_url=SENTRY_API_BASE,
+                headers={"Authorization": f"Bearer {auth_token}"},
+            ) as http_client,
+            mcp.server.stdio.stdio_server() as (read_stream, write_stream),
+        ):
+            server = await serve(http_client)
             await server.run(
                 read_stream,
                 write_stream,
@@ -117,7 +117,7 @@ class SqliteDatabase:
 
     def _synthesize_memo(self) -> str:
         """Synthesizes business insights into a formatted memo"""
-        logger.debug(f"Synthesizing memo with {len(self.insights)} insights")
+        logger.debug("Synthesizing memo with %d insights", len(self.insights))
         if not self.insights:
             return "No business insights have been discovered yet."
 
@@ -136,7 +136,7 @@ class SqliteDatabase:
 
     def _execute_query(self, query: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Execute a SQL query and return results as a list of dictionaries"""
-        logger.debug(f"Executing query: {query}")
+        logger.debug("Executing query: %s", query)
         try:
             with closing(sqlite3.connect(self.db_path)) as conn:
                 conn.row_factory = sqlite3.Row
@@ -149,11 +149,11 @@ class SqliteDatabase:
                     if query.strip().upper().startswith(('INSERT', 'UPDATE', 'DELETE', 'CREATE', 'DROP', 'ALTER')):
                         conn.commit()
                         affected = cursor.rowcount
-                        logger.debug(f"Write query affected {affected} rows")
+                        logger.debug("Write query affected %d rows", affected)
                         return [{"affected_rows": affected}]
 
                     results = [dict(row) for row in cursor.fetchall()]
-                    logger.debug(f"Read query returned {len(results)} rows")
+                    logger.debug("Read query returned %d rows", len(results))
                     return results
         except Exception as e:
             logger.error(f"Database error executing query: {e}")
@@ -182,7 +182,7 @@ async def main(db_path: str):
 
     @server.read_resource()
     async def handle_read_resource(uri: AnyUrl) -> str:
-        logger.debug(f"Handling read_resource request for URI: {uri}")
+        logger.debug("Handling read_resource request for URI: %s", uri)
         if uri.scheme != "memo":
             logger.error(f"Unsupported URI scheme: {uri.scheme}")
             raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
@@ -213,7 +213,7 @@ async def main(db_path: str):
 
     @server.get_prompt()
     async def handle_get_prompt(name: str, arguments: dict[str, str] | None) -> types.GetPromptResult:
-        logger.debug(f"Handling get_prompt request for {name} with args {arguments}")
+        logger.debug("Handling get_prompt request for %s with args %s", name, arguments)
         if name != "mcp-demo":
             logger.error(f"Unknown prompt: {name}")
             raise ValueError(f"Unknown prompt: {name}")
@@ -225,7 +225,7 @@ async def main(db_path: str):
         topic = arguments["topic"]
         prompt = PROMPT_TEMPLATE.format(topic=topic)
 
-        logger.debug(f"Generated prompt template for topic: {topic}")
+        logger.debug("Generated prompt template for topic: %s", topic)
         return types.GetPromptResult(
             description=f"Demo template for {topic}",
             messages=[